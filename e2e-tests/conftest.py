@@ -1,8 +1,16 @@
 """Pytest configuration for e2e tests."""
 
+import asyncio
 import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
 
 import pytest
+import pytest_asyncio
+
+IS_WIN32 = sys.platform == "win32"
 
 
 @pytest.fixture(scope="session")
@@ -19,12 +27,50 @@ def api_key():
 
 @pytest.fixture(scope="session")
 def event_loop_policy():
-    """Use the default event loop policy for all async tests."""
-    import asyncio
+    """Use uvloop for all async tests when available, else the default policy."""
+    if not IS_WIN32:
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.EventLoopPolicy()
 
     return asyncio.get_event_loop_policy()
 
 
+# Backoff delays (seconds) between attempts to remove a directory whose files
+# Windows may still hold open after the CLI subprocess exits
+_CLEANUP_RETRY_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8)
+
+
+async def _rmtree_with_retry(path: str) -> None:
+    """Remove a directory off the event loop, retrying while handles are held."""
+    for delay in _CLEANUP_RETRY_DELAYS:
+        try:
+            await asyncio.to_thread(shutil.rmtree, path)
+            return
+        except PermissionError:
+            if not IS_WIN32:
+                raise
+            await asyncio.sleep(delay)
+    await asyncio.to_thread(shutil.rmtree, path, ignore_errors=True)
+
+
+@pytest_asyncio.fixture
+async def project_dir():
+    """Provide an empty temporary project directory.
+
+    Cleanup only waits when removal actually fails, instead of sleeping
+    unconditionally after every test on Windows.
+    """
+    tmpdir = tempfile.mkdtemp()
+    try:
+        yield Path(tmpdir)
+    finally:
+        await _rmtree_with_retry(tmpdir)
+
+
 def pytest_configure(config):
     """Add e2e marker."""
     config.addinivalue_line("markers", "e2e: marks tests as e2e tests requiring API key")
\ No newline at end of file
@@ -1,33 +1,53 @@
 """End-to-end tests for agents and setting sources with real Claude API calls."""
 
-import asyncio
-import sys
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from claude_agent_sdk import (
     AgentDefinition,
+    AssistantMessage,
     ClaudeAgentOptions,
     ClaudeSDKClient,
+    ResultMessage,
+    SettingSource,
     SystemMessage,
 )
 
+TEST_AGENT = AgentDefinition(
+    description="A test agent for verification",
+    prompt="You are a test agent. Always respond with 'Test agent activated'",
+    tools=["Read"],
+    model="sonnet",
+)
+
+FS_TEST_AGENT_MD = b"""---
+name: fs-test-agent
+description: A filesystem test agent for SDK testing
+tools: Read
+---
+
+# Filesystem Test Agent
+
+You are a simple test agent. When asked a question, provide a brief, helpful answer.
+"""
+
+LOCAL_SETTINGS_JSON = b'{"outputStyle": "local-test-style"}'
+
+TEST_COMMAND_MD = b"""---
+description: Test command
+---
+
+This is a test command.
+"""
+
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
 async def test_agent_definition():
     """Test that custom agent definitions work."""
     options = ClaudeAgentOptions(
-        agents={
-            "test-agent": AgentDefinition(
-                description="A test agent for verification",
-                prompt="You are a test agent. Always respond with 'Test agent activated'",
-                tools=["Read"],
-                model="sonnet",
-            )
-        },
+        agents={"test-agent": TEST_AGENT},
         max_turns=1,
     )
 
@@ -44,12 +64,14 @@ async def test_agent_definition():
                 assert "test-agent" in agents, (
                     f"test-agent should be available, got: {agents}"
                 )
+                # Only the init message is needed; stop the model reply
+                await client.interrupt()
                 break
 
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
-async def test_filesystem_agent_loading():
+async def test_filesystem_agent_loading(project_dir: Path):
     """Test that filesystem-based agents load via setting_sources and produce full response.
 
     This is the core test for issue #406. It verifies that when using
@@ -62,181 +84,109 @@ async def test_filesystem_agent_loading():
     The bug in #406 causes the iterator to complete after only the
     init SystemMessage, never yielding AssistantMessage or ResultMessage.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create a temporary project with a filesystem agent
-        project_dir = Path(tmpdir)
-        agents_dir = project_dir / ".claude" / "agents"
-        agents_dir.mkdir(parents=True)
-
-        # Create a test agent file
-        agent_file = agents_dir / "fs-test-agent.md"
-        agent_file.write_text(
-            """---
-name: fs-test-agent
-description: A filesystem test agent for SDK testing
-tools: Read
----
+    # Create a temporary project with a filesystem agent
+    agents_dir = project_dir / ".claude" / "agents"
+    agents_dir.mkdir(parents=True)
 
-# Filesystem Test Agent
+    # Create a test agent file
+    agent_file = agents_dir / "fs-test-agent.md"
+    agent_file.write_bytes(FS_TEST_AGENT_MD)
 
-You are a simple test agent. When asked a question, provide a brief, helpful answer.
-"""
-        )
-
-        options = ClaudeAgentOptions(
-            setting_sources=["project"],
-            cwd=project_dir,
-            max_turns=1,
-        )
-
-        messages = []
-        async with ClaudeSDKClient(options=options) as client:
-            await client.query("Say hello in exactly 3 words")
-            async for msg in client.receive_response():
-                messages.append(msg)
-
-        # Must have at least init, assistant, result
-        message_types = [type(m).__name__ for m in messages]
-
-        assert "SystemMessage" in message_types, "Missing SystemMessage (init)"
-        assert "AssistantMessage" in message_types, (
-            f"Missing AssistantMessage - got only: {message_types}. "
-            "This may indicate issue #406 (silent failure with filesystem agents)."
-        )
-        assert "ResultMessage" in message_types, "Missing ResultMessage"
-
-        # Find the init message and check for the filesystem agent
-        for msg in messages:
-            if isinstance(msg, SystemMessage) and msg.subtype == "init":
-                agents = msg.data.get("agents", [])
-                # Agents are returned as strings (just names)
-                assert "fs-test-agent" in agents, (
-                    f"fs-test-agent not loaded from filesystem. Found: {agents}"
-                )
-                break
+    options = ClaudeAgentOptions(
+        setting_sources=["project"],
+        cwd=project_dir,
+        max_turns=1,
+    )
 
-        # On Windows, wait for file handles to be released before cleanup
-        if sys.platform == "win32":
-            await asyncio.sleep(0.5)
+    messages = []
+    async with ClaudeSDKClient(options=options) as client:
+        await client.query("Say hello in exactly 3 words")
+        async for msg in client.receive_response():
+            messages.append(msg)
 
+    # Must have at least init, assistant, result
+    message_types = {type(m) for m in messages}
+
+    assert SystemMessage in message_types, "Missing SystemMessage (init)"
+    assert AssistantMessage in message_types, (
+        f"Missing AssistantMessage - got only: {[type(m).__name__ for m in messages]}. "
+        "This may indicate issue #406 (silent failure with filesystem agents)."
+    )
+    assert ResultMessage in message_types, "Missing ResultMessage"
+
+    # Find the init message and check for the filesystem agent
+    for msg in messages:
+        if isinstance(msg, SystemMessage) and msg.subtype == "init":
+            agents = msg.data.get("agents", [])
+            # Agents are returned as strings (just names)
+            assert "fs-test-agent" in agents, (
+                f"fs-test-agent not loaded from filesystem. Found: {agents}"
+            )
+            break
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_setting_sources_default():
-    """Test that default (no setting_sources) loads no settings."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create a temporary project with local settings
-        project_dir = Path(tmpdir)
-        claude_dir = project_dir / ".claude"
-        claude_dir.mkdir(parents=True)
-
-        # Create local settings with custom outputStyle
-        settings_file = claude_dir / "settings.local.json"
-        settings_file.write_text('{"outputStyle": "local-test-style"}')
-
-        # Don't provide setting_sources - should default to no settings
-        options = ClaudeAgentOptions(
-            cwd=project_dir,
-            max_turns=1,
-        )
-
-        async with ClaudeSDKClient(options=options) as client:
-            await client.query("What is 2 + 2?")
-
-            # Check that settings were NOT loaded
-            async for message in client.receive_response():
-                if isinstance(message, SystemMessage) and message.subtype == "init":
-                    output_style = message.data.get("output_style")
-                    assert output_style != "local-test-style", (
-                        f"outputStyle should NOT be from local settings (default is no settings), got: {output_style}"
-                    )
-                    assert output_style == "default", (
-                        f"outputStyle should be 'default', got: {output_style}"
-                    )
-                    break
 
-        # On Windows, wait for file handles to be released before cleanup
-        if sys.platform == "win32":
-            await asyncio.sleep(0.5)
+def _write_project_settings(project_dir: Path) -> None:
+    """Create local settings with a custom outputStyle and a project slash command."""
+    claude_dir = project_dir / ".claude"
+    commands_dir = claude_dir / "commands"
+    commands_dir.mkdir(parents=True)
+
+    (claude_dir / "settings.local.json").write_bytes(LOCAL_SETTINGS_JSON)
+    (commands_dir / "testcmd.md").write_bytes(TEST_COMMAND_MD)
 
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
-async def test_setting_sources_user_only():
-    """Test that setting_sources=['user'] excludes project settings."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create a temporary project with a slash command
-        project_dir = Path(tmpdir)
-        commands_dir = project_dir / ".claude" / "commands"
-        commands_dir.mkdir(parents=True)
-
-        test_command = commands_dir / "testcmd.md"
-        test_command.write_text(
-            """---
-description: Test command
----
-
-This is a test command.
-"""
-        )
-
-        # Use setting_sources=["user"] to exclude project settings
-        options = ClaudeAgentOptions(
-            setting_sources=["user"],
-            cwd=project_dir,
-            max_turns=1,
-        )
-
-        async with ClaudeSDKClient(options=options) as client:
-            await client.query("What is 2 + 2?")
-
-            # Check that project command is NOT available
-            async for message in client.receive_response():
-                if isinstance(message, SystemMessage) and message.subtype == "init":
-                    commands = message.data.get("slash_commands", [])
-                    assert "testcmd" not in commands, (
-                        f"testcmd should NOT be available with user-only sources, got: {commands}"
-                    )
-                    break
+@pytest.mark.parametrize(
+    ("setting_sources", "expected_output_style", "expect_project_command"),
+    [
+        # Default (no setting_sources) loads no settings
+        pytest.param(None, "default", False, id="default"),
+        # setting_sources=['user'] excludes project and local settings
+        pytest.param(["user"], None, False, id="user_only"),
+        # Including project and local sources loads both
+        pytest.param(
+            ["user", "project", "local"],
+            "local-test-style",
+            True,
+            id="project_included",
+        ),
+    ],
+)
+async def test_setting_sources(
+    project_dir: Path,
+    setting_sources: list[SettingSource] | None,
+    expected_output_style: str | None,
+    expect_project_command: bool,
+):
+    """Test which settings are loaded for each setting_sources configuration."""
+    _write_project_settings(project_dir)
 
-        # On Windows, wait for file handles to be released before cleanup
-        if sys.platform == "win32":
-            await asyncio.sleep(0.5)
+    options = ClaudeAgentOptions(
+        setting_sources=setting_sources,
+        cwd=project_dir,
+        max_turns=1,
+    )
 
+    async with ClaudeSDKClient(options=options) as client:
+        await client.query("What is 2 + 2?")
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_setting_sources_project_included():
-    """Test that setting_sources=['user', 'project'] includes project settings."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create a temporary project with local settings
-        project_dir = Path(tmpdir)
-        claude_dir = project_dir / ".claude"
-        claude_dir.mkdir(parents=True)
-
-        # Create local settings with custom outputStyle
-        settings_file = claude_dir / "settings.local.json"
-        settings_file.write_text('{"outputStyle": "local-test-style"}')
-
-        # Use setting_sources=["user", "project", "local"] to include local settings
-        options = ClaudeAgentOptions(
-            setting_sources=["user", "project", "local"],
-            cwd=project_dir,
-            max_turns=1,
-        )
-
-        async with ClaudeSDKClient(options=options) as client:
-            await client.query("What is 2 + 2?")
-
-            # Check that settings WERE loaded
-            async for message in client.receive_response():
-                if isinstance(message, SystemMessage) and message.subtype == "init":
-                    output_style = message.data.get("output_style")
-                    assert output_style == "local-test-style", (
-                        f"outputStyle should be from local settings, got: {output_style}"
+        async for message in client.receive_response():
+            if isinstance(message, SystemMessage) and message.subtype == "init":
+                output_style = message.data.get("output_style")
+                if expected_output_style is None:
+                    assert output_style != "local-test-style", (
+                        f"outputStyle should NOT be from local settings, got: {output_style}"
+                    )
+                else:
+                    assert output_style == expected_output_style, (
+                        f"outputStyle should be '{expected_output_style}', got: {output_style}"
                     )
-                    break
 
-        # On Windows, wait for file handles to be released before cleanup
-        if sys.platform == "win32":
-            await asyncio.sleep(0.5)
+                commands = message.data.get("slash_commands", [])
+                assert ("testcmd" in commands) == expect_project_command, (
+                    f"testcmd availability should be {expect_project_command}, got: {commands}"
+                )
+                # Only the init message is needed; stop the model reply
+                await client.interrupt()
+                break
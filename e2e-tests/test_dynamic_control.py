@@ -1,5 +1,7 @@
 """End-to-end tests for dynamic control features with real Claude API calls."""
 
+import logging
+
 import pytest
 
 from claude_agent_sdk import (
@@ -7,6 +9,14 @@ from claude_agent_sdk import (
     ClaudeSDKClient,
 )
 
+logger = logging.getLogger(__name__)
+
+
+async def drain_response(client: ClaudeSDKClient, label: str) -> None:
+    """Consume one response, logging each message at debug level."""
+    async for message in client.receive_response():
+        logger.debug("%s: %r", label, message)
+
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
@@ -23,20 +33,14 @@ async def test_set_permission_mode():
 
         # Make a query that would normally require permission
         await client.query("What is 2+2? Just respond with the number.")
-
-        async for message in client.receive_response():
-            print(f"Got message: {message}")
-            pass  # Just consume messages
+        await drain_response(client, "Got message")
 
         # Change back to default
         await client.set_permission_mode("default")
 
         # Make another query
         await client.query("What is 3+3? Just respond with the number.")
-
-        async for message in client.receive_response():
-            print(f"Got message: {message}")
-            pass  # Just consume messages
+        await drain_response(client, "Got message")
 
 
 @pytest.mark.e2e
@@ -49,28 +53,19 @@ async def test_set_model():
     async with ClaudeSDKClient(options=options) as client:
         # Start with default model
         await client.query("What is 1+1? Just the number.")
-
-        async for message in client.receive_response():
-            print(f"Default model response: {message}")
-            pass
+        await drain_response(client, "Default model response")
 
         # Switch to Haiku model
         await client.set_model("claude-3-5-haiku-20241022")
 
         await client.query("What is 2+2? Just the number.")
-
-        async for message in client.receive_response():
-            print(f"Haiku model response: {message}")
-            pass
+        await drain_response(client, "Haiku model response")
 
         # Switch back to default (None means default)
         await client.set_model(None)
 
         await client.query("What is 3+3? Just the number.")
-
-        async for message in client.receive_response():
-            print(f"Back to default model: {message}")
-            pass
+        await drain_response(client, "Back to default model")
 
 
 @pytest.mark.e2e
@@ -92,6 +87,4 @@ async def test_interrupt():
             print(f"Interrupt resulted in: {e}")
 
         # Consume any remaining messages
-        async for message in client.receive_response():
-            print(f"Got message after interrupt: {message}")
-            pass
+        await drain_response(client, "Got message after interrupt")
@@ -1,5 +1,7 @@
 """End-to-end tests for hook callbacks with real Claude API calls."""
 
+import logging
+
 import pytest
 
 from claude_agent_sdk import (
@@ -11,20 +13,22 @@ from claude_agent_sdk import (
     HookMatcher,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
 async def test_hook_with_permission_decision_and_reason():
     """Test that hooks with permissionDecision and reason fields work end-to-end."""
-    hook_invocations = []
+    hook_invocations: set[str] = set()
 
     async def test_hook(
-        input_data: HookInput, tool_use_id: str | None, context: HookContext
+        input_data: HookInput, _tool_use_id: str | None, _context: HookContext, /
     ) -> HookJSONOutput:
         """Hook that uses permissionDecision and reason fields."""
         tool_name = input_data.get("tool_name", "")
-        print(f"Hook called for tool: {tool_name}")
-        hook_invocations.append(tool_name)
+        logger.debug("Hook called for tool: %s", tool_name)
+        hook_invocations.add(tool_name)
 
         # Block Bash commands for this test
         if tool_name == "Bash":
@@ -60,7 +64,7 @@ async def test_hook_with_permission_decision_and_reason():
         await client.query("Run this bash command: echo 'hello'")
 
         async for message in client.receive_response():
-            print(f"Got message: {message}")
+            logger.debug("Got message: %r", message)
 
     print(f"Hook invocations: {hook_invocations}")
     # Verify hook was called
@@ -71,14 +75,14 @@ async def test_hook_with_permission_decision_and_reason():
 @pytest.mark.asyncio
 async def test_hook_with_continue_and_stop_reason():
     """Test that hooks with continue_=False and stopReason fields work end-to-end."""
-    hook_invocations = []
+    hook_invocations: set[str] = set()
 
     async def post_tool_hook(
-        input_data: HookInput, tool_use_id: str | None, context: HookContext
+        input_data: HookInput, _tool_use_id: str | None, _context: HookContext, /
     ) -> HookJSONOutput:
         """PostToolUse hook that stops execution with stopReason."""
         tool_name = input_data.get("tool_name", "")
-        hook_invocations.append(tool_name)
+        hook_invocations.add(tool_name)
 
         # Actually test continue_=False and stopReason fields
         return {
@@ -101,7 +105,7 @@ async def test_hook_with_continue_and_stop_reason():
         await client.query("Run: echo 'test message'")
 
         async for message in client.receive_response():
-            print(f"Got message: {message}")
+            logger.debug("Got message: %r", message)
 
     print(f"Hook invocations: {hook_invocations}")
     # Verify hook was called
@@ -112,13 +116,13 @@ async def test_hook_with_continue_and_stop_reason():
 @pytest.mark.asyncio
 async def test_hook_with_additional_context():
     """Test that hooks with hookSpecificOutput work end-to-end."""
-    hook_invocations = []
+    hook_invocations: set[str] = set()
 
     async def context_hook(
-        input_data: HookInput, tool_use_id: str | None, context: HookContext
+        _input_data: HookInput, _tool_use_id: str | None, _context: HookContext, /
     ) -> HookJSONOutput:
         """Hook that provides additional context."""
-        hook_invocations.append("context_added")
+        hook_invocations.add("context_added")
 
         return {
             "systemMessage": "Additional context provided by hook",
@@ -143,7 +147,7 @@ async def test_hook_with_additional_context():
         await client.query("Run: echo 'testing hooks'")
 
         async for message in client.receive_response():
-            print(f"Got message: {message}")
+            logger.debug("Got message: %r", message)
 
     print(f"Hook invocations: {hook_invocations}")
     # Verify hook was called
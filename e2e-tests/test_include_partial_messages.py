@@ -4,8 +4,8 @@ These tests verify that the SDK properly handles partial message streaming,
 including StreamEvent parsing and message interleaving.
 """
 
-import asyncio
-from typing import List, Any
+from dataclasses import dataclass, field
+from typing import Any
 
 import pytest
 
@@ -21,6 +21,46 @@ from claude_agent_sdk.types import (
 )
 
 
+@dataclass
+class MessageSummary:
+    """What a message stream contained, tallied as the messages arrive."""
+
+    first: Any = None
+    last: Any = None
+    system_messages: int = 0
+    stream_events: int = 0
+    assistant_messages: int = 0
+    result_messages: int = 0
+    event_types: set[str] = field(default_factory=set)
+    has_thinking: bool = False
+    has_text: bool = False
+
+    def add(self, msg: Any) -> None:
+        """Classify one message and its content blocks."""
+        if self.first is None:
+            self.first = msg
+        self.last = msg
+
+        if isinstance(msg, StreamEvent):
+            self.stream_events += 1
+            self.event_types.add(msg.event.get("type"))
+        elif isinstance(msg, AssistantMessage):
+            self.assistant_messages += 1
+            # Stop looking at blocks once both kinds have been seen
+            for block in msg.content:
+                if self.has_thinking and self.has_text:
+                    break
+                block_type = type(block)
+                if block_type is ThinkingBlock:
+                    self.has_thinking = True
+                elif block_type is TextBlock:
+                    self.has_text = True
+        elif isinstance(msg, SystemMessage):
+            self.system_messages += 1
+        elif isinstance(msg, ResultMessage):
+            self.result_messages += 1
+
+
 @pytest.mark.e2e
 @pytest.mark.asyncio
 async def test_include_partial_messages_stream_events():
@@ -35,29 +75,24 @@ async def test_include_partial_messages_stream_events():
         },
     )
 
-    collected_messages: List[Any] = []
+    summary = MessageSummary()
 
     async with ClaudeSDKClient(options) as client:
         # Send a simple prompt that will generate streaming response with thinking
         await client.query("Think of three jokes, then tell one")
 
         async for message in client.receive_response():
-            collected_messages.append(message)
-
-    # Verify we got the expected message types
-    message_types = [type(msg).__name__ for msg in collected_messages]
+            summary.add(message)
 
     # Should have SystemMessage(init) at the start
-    assert message_types[0] == "SystemMessage"
-    assert isinstance(collected_messages[0], SystemMessage)
-    assert collected_messages[0].subtype == "init"
+    assert isinstance(summary.first, SystemMessage)
+    assert summary.first.subtype == "init"
 
     # Should have multiple StreamEvent messages
-    stream_events = [msg for msg in collected_messages if isinstance(msg, StreamEvent)]
-    assert len(stream_events) > 0, "No StreamEvent messages received"
+    assert summary.stream_events > 0, "No StreamEvent messages received"
 
     # Check for expected StreamEvent types
-    event_types = [event.event.get("type") for event in stream_events]
+    event_types = summary.event_types
     assert "message_start" in event_types, "No message_start StreamEvent"
     assert "content_block_start" in event_types, "No content_block_start StreamEvent"
     assert "content_block_delta" in event_types, "No content_block_delta StreamEvent"
@@ -65,26 +100,17 @@ async def test_include_partial_messages_stream_events():
     assert "message_stop" in event_types, "No message_stop StreamEvent"
 
     # Should have AssistantMessage messages with thinking and text
-    assistant_messages = [msg for msg in collected_messages if isinstance(msg, AssistantMessage)]
-    assert len(assistant_messages) >= 1, "No AssistantMessage received"
+    assert summary.assistant_messages >= 1, "No AssistantMessage received"
 
     # Check for thinking block in at least one AssistantMessage
-    has_thinking = any(
-        any(isinstance(block, ThinkingBlock) for block in msg.content)
-        for msg in assistant_messages
-    )
-    assert has_thinking, "No ThinkingBlock found in AssistantMessages"
+    assert summary.has_thinking, "No ThinkingBlock found in AssistantMessages"
 
     # Check for text block (the joke) in at least one AssistantMessage
-    has_text = any(
-        any(isinstance(block, TextBlock) for block in msg.content)
-        for msg in assistant_messages
-    )
-    assert has_text, "No TextBlock found in AssistantMessages"
+    assert summary.has_text, "No TextBlock found in AssistantMessages"
 
     # Should end with ResultMessage
-    assert isinstance(collected_messages[-1], ResultMessage)
-    assert collected_messages[-1].subtype == "success"
+    assert isinstance(summary.last, ResultMessage)
+    assert summary.last.subtype == "success"
 
 
 @pytest.mark.e2e
@@ -136,19 +162,18 @@ async def test_partial_messages_disabled_by_default():
         max_turns=2,
     )
 
-    collected_messages: List[Any] = []
+    summary = MessageSummary()
 
     async with ClaudeSDKClient(options) as client:
         await client.query("Say hello")
 
         async for message in client.receive_response():
-            collected_messages.append(message)
+            summary.add(message)
 
     # Should NOT have any StreamEvent messages
-    stream_events = [msg for msg in collected_messages if isinstance(msg, StreamEvent)]
-    assert len(stream_events) == 0, "StreamEvent messages present when partial messages disabled"
+    assert summary.stream_events == 0, "StreamEvent messages present when partial messages disabled"
 
     # Should still have the regular messages
-    assert any(isinstance(msg, SystemMessage) for msg in collected_messages)
-    assert any(isinstance(msg, AssistantMessage) for msg in collected_messages)
-    assert any(isinstance(msg, ResultMessage) for msg in collected_messages)
\ No newline at end of file
+    assert summary.system_messages > 0
+    assert summary.assistant_messages > 0
+    assert summary.result_messages > 0
\ No newline at end of file
@@ -5,8 +5,12 @@ actual API calls to Claude with JSON Schema validation.
 """
 
 import tempfile
+from contextlib import aclosing
+from typing import Any
 
 import pytest
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
 from claude_agent_sdk import (
     ClaudeAgentOptions,
@@ -15,36 +19,103 @@ from claude_agent_sdk import (
 )
 
 
+def compile_validator(schema: dict[str, Any]) -> Validator:
+    """Check a schema and build a reusable validator for it."""
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+async def query_until_result(
+    prompt: str, options: ClaudeAgentOptions
+) -> ResultMessage | None:
+    """Run a query and return its ResultMessage as soon as it arrives.
+
+    The stream is closed in this task via aclosing() rather than being left
+    for the async generator finalizer after an early return.
+    """
+    async with aclosing(query(prompt=prompt, options=options)) as messages:
+        async for message in messages:
+            if isinstance(message, ResultMessage):
+                return message
+    return None
+
+
+# Schemas for the output_format of each test, plus a validator compiled once
+# per schema for checking the returned structured_output locally
+SIMPLE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "file_count": {"type": "number"},
+        "has_tests": {"type": "boolean"},
+        "test_file_count": {"type": "number"},
+    },
+    "required": ["file_count", "has_tests"],
+}
+
+NESTED_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "analysis": {
+            "type": "object",
+            "properties": {
+                "word_count": {"type": "number"},
+                "character_count": {"type": "number"},
+            },
+            "required": ["word_count", "character_count"],
+        },
+        "words": {
+            "type": "array",
+            "items": {"type": "string"},
+        },
+    },
+    "required": ["analysis", "words"],
+}
+
+ENUM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "has_tests": {"type": "boolean"},
+        "test_framework": {
+            "type": "string",
+            "enum": ["pytest", "unittest", "nose", "unknown"],
+        },
+        "test_count": {"type": "number"},
+    },
+    "required": ["has_tests", "test_framework"],
+}
+
+TOOLS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "file_count": {"type": "number"},
+        "has_readme": {"type": "boolean"},
+    },
+    "required": ["file_count", "has_readme"],
+}
+
+SIMPLE_VALIDATOR = compile_validator(SIMPLE_SCHEMA)
+NESTED_VALIDATOR = compile_validator(NESTED_SCHEMA)
+ENUM_VALIDATOR = compile_validator(ENUM_SCHEMA)
+TOOLS_VALIDATOR = compile_validator(TOOLS_SCHEMA)
+
+
 @pytest.mark.e2e
 @pytest.mark.asyncio
 async def test_simple_structured_output():
     """Test structured output with file counting requiring tool use."""
 
-    # Define schema for file analysis
-    schema = {
-        "type": "object",
-        "properties": {
-            "file_count": {"type": "number"},
-            "has_tests": {"type": "boolean"},
-            "test_file_count": {"type": "number"},
-        },
-        "required": ["file_count", "has_tests"],
-    }
-
     options = ClaudeAgentOptions(
-        output_format={"type": "json_schema", "schema": schema},
+        output_format={"type": "json_schema", "schema": SIMPLE_SCHEMA},
         permission_mode="acceptEdits",
         cwd=".",  # Use current directory
     )
 
     # Agent must use Glob/Bash to count files
-    result_message = None
-    async for message in query(
+    result_message = await query_until_result(
         prompt="Count how many Python files are in src/claude_agent_sdk/ and check if there are any test files. Use tools to explore the filesystem.",
         options=options,
-    ):
-        if isinstance(message, ResultMessage):
-            result_message = message
+    )
 
     # Verify result
     assert result_message is not None, "No result message received"
@@ -53,10 +124,7 @@ async def test_simple_structured_output():
 
     # Verify structured output is present and valid
     assert result_message.structured_output is not None, "No structured output in result"
-    assert "file_count" in result_message.structured_output
-    assert "has_tests" in result_message.structured_output
-    assert isinstance(result_message.structured_output["file_count"], (int, float))
-    assert isinstance(result_message.structured_output["has_tests"], bool)
+    SIMPLE_VALIDATOR.validate(result_message.structured_output)
 
     # Should find Python files in src/
     assert result_message.structured_output["file_count"] > 0
@@ -67,38 +135,15 @@ async def test_simple_structured_output():
 async def test_nested_structured_output():
     """Test structured output with nested objects and arrays."""
 
-    # Define a schema with nested structure
-    schema = {
-        "type": "object",
-        "properties": {
-            "analysis": {
-                "type": "object",
-                "properties": {
-                    "word_count": {"type": "number"},
-                    "character_count": {"type": "number"},
-                },
-                "required": ["word_count", "character_count"],
-            },
-            "words": {
-                "type": "array",
-                "items": {"type": "string"},
-            },
-        },
-        "required": ["analysis", "words"],
-    }
-
     options = ClaudeAgentOptions(
-        output_format={"type": "json_schema", "schema": schema},
+        output_format={"type": "json_schema", "schema": NESTED_SCHEMA},
         permission_mode="acceptEdits",
     )
 
-    result_message = None
-    async for message in query(
+    result_message = await query_until_result(
         prompt="Analyze this text: 'Hello world'. Provide word count, character count, and list of words.",
         options=options,
-    ):
-        if isinstance(message, ResultMessage):
-            result_message = message
+    )
 
     # Verify result
     assert result_message is not None
@@ -107,8 +152,7 @@ async def test_nested_structured_output():
 
     # Check nested structure
     output = result_message.structured_output
-    assert "analysis" in output
-    assert "words" in output
+    NESTED_VALIDATOR.validate(output)
     assert output["analysis"]["word_count"] == 2
     assert output["analysis"]["character_count"] == 11  # "Hello world"
     assert len(output["words"]) == 2
@@ -119,32 +163,16 @@ async def test_nested_structured_output():
 async def test_structured_output_with_enum():
     """Test structured output with enum constraints requiring code analysis."""
 
-    schema = {
-        "type": "object",
-        "properties": {
-            "has_tests": {"type": "boolean"},
-            "test_framework": {
-                "type": "string",
-                "enum": ["pytest", "unittest", "nose", "unknown"],
-            },
-            "test_count": {"type": "number"},
-        },
-        "required": ["has_tests", "test_framework"],
-    }
-
     options = ClaudeAgentOptions(
-        output_format={"type": "json_schema", "schema": schema},
+        output_format={"type": "json_schema", "schema": ENUM_SCHEMA},
         permission_mode="acceptEdits",
         cwd=".",
     )
 
-    result_message = None
-    async for message in query(
+    result_message = await query_until_result(
         prompt="Search for test files in the tests/ directory. Determine which test framework is being used (pytest/unittest/nose) and count how many test files exist. Use Grep to search for framework imports.",
         options=options,
-    ):
-        if isinstance(message, ResultMessage):
-            result_message = message
+    )
 
     # Verify result
     assert result_message is not None
@@ -153,8 +181,7 @@ async def test_structured_output_with_enum():
 
     # Check enum values are valid
     output = result_message.structured_output
-    assert output["test_framework"] in ["pytest", "unittest", "nose", "unknown"]
-    assert isinstance(output["has_tests"], bool)
+    ENUM_VALIDATOR.validate(output)
 
     # This repo uses pytest
     assert output["has_tests"] is True
@@ -166,29 +193,16 @@ async def test_structured_output_with_enum():
 async def test_structured_output_with_tools():
     """Test structured output when agent uses tools."""
 
-    # Schema for file analysis
-    schema = {
-        "type": "object",
-        "properties": {
-            "file_count": {"type": "number"},
-            "has_readme": {"type": "boolean"},
-        },
-        "required": ["file_count", "has_readme"],
-    }
-
     options = ClaudeAgentOptions(
-        output_format={"type": "json_schema", "schema": schema},
+        output_format={"type": "json_schema", "schema": TOOLS_SCHEMA},
         permission_mode="acceptEdits",
         cwd=tempfile.gettempdir(),  # Cross-platform temp directory
     )
 
-    result_message = None
-    async for message in query(
+    result_message = await query_until_result(
         prompt="Count how many files are in the current directory and check if there's a README file. Use tools as needed.",
         options=options,
-    ):
-        if isinstance(message, ResultMessage):
-            result_message = message
+    )
 
     # Verify result
     assert result_message is not None
@@ -197,8 +211,5 @@ async def test_structured_output_with_tools():
 
     # Check structure
     output = result_message.structured_output
-    assert "file_count" in output
-    assert "has_readme" in output
-    assert isinstance(output["file_count"], (int, float))
-    assert isinstance(output["has_readme"], bool)
+    TOOLS_VALIDATOR.validate(output)
     assert output["file_count"] >= 0  # Should be non-negative
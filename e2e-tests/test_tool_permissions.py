@@ -20,7 +20,8 @@ async def test_permission_callback_gets_called():
     async def permission_callback(
         tool_name: str,
         input_data: dict,
-        context: ToolPermissionContext
+        _context: ToolPermissionContext,
+        /,
     ) -> PermissionResultAllow | PermissionResultDeny:
         """Track callback invocation."""
         print(f"Permission callback called for: {tool_name}, input: {input_data}")
@@ -0,0 +1,42 @@
+"""Small helpers shared by the examples."""
+
+import sys
+from collections.abc import Awaitable, Callable, Iterator
+
+import anyio
+
+from claude_agent_sdk import AssistantMessage, TextBlock, UserMessage
+
+
+def iter_text(msg: AssistantMessage | UserMessage) -> Iterator[str]:
+    """Yield the text of each TextBlock in a message, in order."""
+    return (block.text for block in msg.content if type(block) is TextBlock)
+
+
+def print_text_blocks(msg: AssistantMessage | UserMessage, speaker: str) -> None:
+    """Print a message's text blocks as "<speaker>: <text>" lines in one write.
+
+    print() would write the trailing newline separately, which on a
+    line-buffered terminal costs a second flush.
+    """
+    text = "".join(f"{speaker}: {text}\n" for text in iter_text(msg))
+    if text:
+        sys.stdout.write(text)
+
+
+async def gather_outputs(*examples: Callable[[], Awaitable[str]]) -> list[str]:
+    """Run independent examples concurrently and return their outputs in order.
+
+    Each example buffers what it would print and returns it, so the outputs
+    can be shown in a stable order however the runs interleave.
+    """
+    outputs = [""] * len(examples)
+
+    async def run(index: int) -> None:
+        outputs[index] = await examples[index]()
+
+    async with anyio.create_task_group() as tg:
+        for index in range(len(examples)):
+            tg.start_soon(run, index)
+
+    return outputs
@@ -4,11 +4,17 @@
 This example demonstrates how to define and use custom agents with specific
 tools, prompts, and models.
 
+The examples are independent, so they run concurrently. Each one buffers its
+output, and the outputs are printed in order once all have finished.
+
 Usage:
 ./examples/agents.py - Run the example
 """
 
+import io
+
 import anyio
+from _util import gather_outputs
 
 from claude_agent_sdk import (
     AgentDefinition,
@@ -22,7 +28,8 @@ from claude_agent_sdk import (
 
 async def code_reviewer_example():
     """Example using a custom code reviewer agent."""
-    print("=== Code Reviewer Agent Example ===")
+    out = io.StringIO()
+    print("=== Code Reviewer Agent Example ===", file=out)
 
     options = ClaudeAgentOptions(
         agents={
@@ -44,15 +51,17 @@ async def code_reviewer_example():
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
-                    print(f"Claude: {block.text}")
+                    print(f"Claude: {block.text}", file=out)
         elif isinstance(message, ResultMessage) and message.total_cost_usd and message.total_cost_usd > 0:
-            print(f"\nCost: ${message.total_cost_usd:.4f}")
-    print()
+            print(f"\nCost: ${message.total_cost_usd:.4f}", file=out)
+    print(file=out)
+    return out.getvalue()
 
 
 async def documentation_writer_example():
     """Example using a documentation writer agent."""
-    print("=== Documentation Writer Agent Example ===")
+    out = io.StringIO()
+    print("=== Documentation Writer Agent Example ===", file=out)
 
     options = ClaudeAgentOptions(
         agents={
@@ -73,15 +82,17 @@ async def documentation_writer_example():
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
-                    print(f"Claude: {block.text}")
+                    print(f"Claude: {block.text}", file=out)
         elif isinstance(message, ResultMessage) and message.total_cost_usd and message.total_cost_usd > 0:
-            print(f"\nCost: ${message.total_cost_usd:.4f}")
-    print()
+            print(f"\nCost: ${message.total_cost_usd:.4f}", file=out)
+    print(file=out)
+    return out.getvalue()
 
 
 async def multiple_agents_example():
     """Example with multiple custom agents."""
-    print("=== Multiple Agents Example ===")
+    out = io.StringIO()
+    print("=== Multiple Agents Example ===", file=out)
 
     options = ClaudeAgentOptions(
         agents={
@@ -107,17 +118,19 @@ async def multiple_agents_example():
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
-                    print(f"Claude: {block.text}")
+                    print(f"Claude: {block.text}", file=out)
         elif isinstance(message, ResultMessage) and message.total_cost_usd and message.total_cost_usd > 0:
-            print(f"\nCost: ${message.total_cost_usd:.4f}")
-    print()
+            print(f"\nCost: ${message.total_cost_usd:.4f}", file=out)
+    print(file=out)
+    return out.getvalue()
 
 
 async def main():
-    """Run all agent examples."""
-    await code_reviewer_example()
-    await documentation_writer_example()
-    await multiple_agents_example()
+    """Run all agent examples concurrently."""
+    outputs = await gather_outputs(
+        code_reviewer_example, documentation_writer_example, multiple_agents_example
+    )
+    print("".join(outputs), end="")
 
 
 if __name__ == "__main__":
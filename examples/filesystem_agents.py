@@ -26,18 +26,13 @@ from claude_agent_sdk import (
 
 
 def extract_agents(msg: SystemMessage) -> list[str]:
-    """Extract agent names from system message init data."""
-    if msg.subtype == "init":
-        agents = msg.data.get("agents", [])
-        # Agents can be either strings or dicts with a 'name' field
-        result = []
-        for a in agents:
-            if isinstance(a, str):
-                result.append(a)
-            elif isinstance(a, dict):
-                result.append(a.get("name", ""))
-        return result
-    return []
+    """Extract agent names from an init system message."""
+    # Agents can be either strings or dicts with a 'name' field
+    return [
+        a if isinstance(a, str) else a.get("name", "")
+        for a in msg.data.get("agents") or ()
+        if isinstance(a, (str, dict))
+    ]
 
 
 async def main():
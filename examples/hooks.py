@@ -13,6 +13,7 @@ Usage:
 import asyncio
 import logging
 import sys
+from collections.abc import Callable
 from typing import Any
 
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
@@ -27,19 +28,104 @@ from claude_agent_sdk.types import (
     TextBlock,
 )
 
-# Set up logging to see what's happening
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Substrings that make check_bash_command deny a command
+BLOCK_PATTERNS = ("foo.sh",)
 
-def display_message(msg: Message) -> None:
-    """Standardized message display function."""
-    if isinstance(msg, AssistantMessage):
-        for block in msg.content:
-            if isinstance(block, TextBlock):
-                print(f"Claude: {block.text}")
-    elif isinstance(msg, ResultMessage):
-        print("Result ended")
+# Hook outputs that never change are built once and shared across calls. They
+# are returned as-is and never mutated by the SDK, so sharing them is safe.
+NO_DECISION: HookJSONOutput = {}
+
+FAVORITE_COLOR_CONTEXT: HookJSONOutput = {
+    "hookSpecificOutput": {
+        "hookEventName": "SessionStart",
+        "additionalContext": "My favorite color is hot pink",
+    }
+}
+
+TOOL_ERROR_FEEDBACK: HookJSONOutput = {
+    "systemMessage": "⚠️ The command produced an error",
+    "reason": "Tool execution failed - consider checking the command syntax",
+    "hookSpecificOutput": {
+        "hookEventName": "PostToolUse",
+        "additionalContext": "The command encountered an error. You may want to try a different approach.",
+    }
+}
+
+IMPORTANT_WRITE_DENIED: HookJSONOutput = {
+    "reason": "Writes to files containing 'important' in the name are not allowed for safety",
+    "systemMessage": "🚫 Write operation blocked by security policy",
+    "hookSpecificOutput": {
+        "hookEventName": "PreToolUse",
+        "permissionDecision": "deny",
+        "permissionDecisionReason": "Security policy blocks writes to important files",
+    },
+}
+
+TOOL_USE_APPROVED: HookJSONOutput = {
+    "reason": "Tool use approved after security review",
+    "hookSpecificOutput": {
+        "hookEventName": "PreToolUse",
+        "permissionDecision": "allow",
+        "permissionDecisionReason": "Tool passed security checks",
+    },
+}
+
+CRITICAL_ERROR_STOP: HookJSONOutput = {
+    "continue_": False,
+    "stopReason": "Critical error detected in tool output - execution halted for safety",
+    "systemMessage": "🛑 Execution stopped due to critical error",
+}
+
+CONTINUE: HookJSONOutput = {"continue_": True}
+
+
+def _format_assistant(msg: AssistantMessage) -> str:
+    return "".join(
+        f"Claude: {block.text}\n" for block in msg.content if type(block) is TextBlock
+    )
+
+
+def _format_result(msg: ResultMessage) -> str:
+    return "Result ended\n"
+
+
+# Display text builders keyed by exact message type; other messages are not shown
+MESSAGE_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    AssistantMessage: _format_assistant,
+    ResultMessage: _format_result,
+}
+
+
+def format_message(msg: Message) -> str:
+    """Standardized message display text, empty for messages not shown."""
+    formatter = MESSAGE_FORMATTERS.get(type(msg))
+    return formatter(msg) if formatter is not None else ""
+
+
+async def drain_and_display(client: ClaudeSDKClient) -> None:
+    """Display one response, writing each message as it arrives."""
+    async for msg in client.receive_response():
+        text = format_message(msg)
+        if text:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+
+def response_mentions(tool_response: Any, word: str) -> bool:
+    """Check a tool response's text values for word, ignoring case.
+
+    Structured responses are walked field by field rather than stringified
+    whole, so large payloads are not re-rendered and key names do not match.
+    """
+    if isinstance(tool_response, str):
+        return word in tool_response.lower()
+    if isinstance(tool_response, dict):
+        return any(response_mentions(value, word) for value in tool_response.values())
+    if isinstance(tool_response, list):
+        return any(response_mentions(item, word) for item in tool_response)
+    return word in str(tool_response).lower()
 
 
 ##### Hook callback functions
@@ -47,39 +133,32 @@ async def check_bash_command(
     input_data: HookInput, tool_use_id: str | None, context: HookContext
 ) -> HookJSONOutput:
     """Prevent certain bash commands from being executed."""
-    tool_name = input_data["tool_name"]
-    tool_input = input_data["tool_input"]
-
-    if tool_name != "Bash":
-        return {}
-
-    command = tool_input.get("command", "")
-    block_patterns = ["foo.sh"]
-
-    for pattern in block_patterns:
-        if pattern in command:
-            logger.warning(f"Blocked command: {command}")
-            return {
-                "hookSpecificOutput": {
-                    "hookEventName": "PreToolUse",
-                    "permissionDecision": "deny",
-                    "permissionDecisionReason": f"Command contains invalid pattern: {pattern}",
-                }
+    # Reject other tools before touching their input. String == already
+    # short-circuits on identity, and JSON-decoded names are not interned.
+    if input_data["tool_name"] != "Bash":
+        return NO_DECISION
+
+    command = input_data["tool_input"].get("command", "")
+
+    pattern = next((p for p in BLOCK_PATTERNS if p in command), None)
+    if pattern is not None:
+        logger.warning(f"Blocked command: {command}")
+        return {
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": "deny",
+                "permissionDecisionReason": f"Command contains invalid pattern: {pattern}",
             }
+        }
 
-    return {}
+    return NO_DECISION
 
 
 async def add_custom_instructions(
     input_data: HookInput, tool_use_id: str | None, context: HookContext
 ) -> HookJSONOutput:
     """Add custom instructions when a session starts."""
-    return {
-        "hookSpecificOutput": {
-            "hookEventName": "SessionStart",
-            "additionalContext": "My favorite color is hot pink",
-        }
-    }
+    return FAVORITE_COLOR_CONTEXT
 
 
 async def review_tool_output(
@@ -89,17 +168,10 @@ async def review_tool_output(
     tool_response = input_data.get("tool_response", "")
 
     # If the tool produced an error, add helpful context
-    if "error" in str(tool_response).lower():
-        return {
-            "systemMessage": "⚠️ The command produced an error",
-            "reason": "Tool execution failed - consider checking the command syntax",
-            "hookSpecificOutput": {
-                "hookEventName": "PostToolUse",
-                "additionalContext": "The command encountered an error. You may want to try a different approach.",
-            }
-        }
+    if response_mentions(tool_response, "error"):
+        return TOOL_ERROR_FEEDBACK
 
-    return {}
+    return NO_DECISION
 
 
 async def strict_approval_hook(
@@ -114,25 +186,10 @@ async def strict_approval_hook(
         file_path = tool_input.get("file_path", "")
         if "important" in file_path.lower():
             logger.warning(f"Blocked Write to: {file_path}")
-            return {
-                "reason": "Writes to files containing 'important' in the name are not allowed for safety",
-                "systemMessage": "🚫 Write operation blocked by security policy",
-                "hookSpecificOutput": {
-                    "hookEventName": "PreToolUse",
-                    "permissionDecision": "deny",
-                    "permissionDecisionReason": "Security policy blocks writes to important files",
-                },
-            }
+            return IMPORTANT_WRITE_DENIED
 
     # Allow everything else explicitly
-    return {
-        "reason": "Tool use approved after security review",
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "allow",
-            "permissionDecisionReason": "Tool passed security checks",
-        },
-    }
+    return TOOL_USE_APPROVED
 
 
 async def stop_on_error_hook(
@@ -142,15 +199,11 @@ async def stop_on_error_hook(
     tool_response = input_data.get("tool_response", "")
 
     # Stop execution if we see a critical error
-    if "critical" in str(tool_response).lower():
+    if response_mentions(tool_response, "critical"):
         logger.error("Critical error detected - stopping execution")
-        return {
-            "continue_": False,
-            "stopReason": "Critical error detected in tool output - execution halted for safety",
-            "systemMessage": "🛑 Execution stopped due to critical error",
-        }
+        return CRITICAL_ERROR_STOP
 
-    return {"continue_": True}
+    return CONTINUE
 
 
 async def example_pretooluse() -> None:
@@ -174,8 +227,7 @@ async def example_pretooluse() -> None:
         print("User: Run the bash command: ./foo.sh --help")
         await client.query("Run the bash command: ./foo.sh --help")
 
-        async for msg in client.receive_response():
-            display_message(msg)
+        await drain_and_display(client)
 
         print("\n" + "=" * 50 + "\n")
 
@@ -184,8 +236,7 @@ async def example_pretooluse() -> None:
         print("User: Run the bash command: echo 'Hello from hooks example!'")
         await client.query("Run the bash command: echo 'Hello from hooks example!'")
 
-        async for msg in client.receive_response():
-            display_message(msg)
+        await drain_and_display(client)
 
         print("\n" + "=" * 50 + "\n")
 
@@ -209,8 +260,7 @@ async def example_userpromptsubmit() -> None:
         print("User: What's my favorite color?")
         await client.query("What's my favorite color?")
 
-        async for msg in client.receive_response():
-            display_message(msg)
+        await drain_and_display(client)
 
     print("\n")
 
@@ -233,8 +283,7 @@ async def example_posttooluse() -> None:
         print("User: Run a command that will produce an error: ls /nonexistent_directory")
         await client.query("Run this command: ls /nonexistent_directory")
 
-        async for msg in client.receive_response():
-            display_message(msg)
+        await drain_and_display(client)
 
     print("\n")
 
@@ -260,8 +309,7 @@ async def example_decision_fields() -> None:
         print("User: Write 'test' to important_config.txt")
         await client.query("Write the text 'test data' to a file called important_config.txt")
 
-        async for msg in client.receive_response():
-            display_message(msg)
+        await drain_and_display(client)
 
         print("\n" + "=" * 50 + "\n")
 
@@ -270,8 +318,7 @@ async def example_decision_fields() -> None:
         print("User: Write 'test' to regular_file.txt")
         await client.query("Write the text 'test data' to a file called regular_file.txt")
 
-        async for msg in client.receive_response():
-            display_message(msg)
+        await drain_and_display(client)
 
     print("\n")
 
@@ -294,57 +341,66 @@ async def example_continue_control() -> None:
         print("User: Run a command that outputs 'CRITICAL ERROR'")
         await client.query("Run this bash command: echo 'CRITICAL ERROR: system failure'")
 
-        async for msg in client.receive_response():
-            display_message(msg)
+        await drain_and_display(client)
 
     print("\n")
 
 
+EXAMPLES = {
+    "PreToolUse": example_pretooluse,
+    "UserPromptSubmit": example_userpromptsubmit,
+    "PostToolUse": example_posttooluse,
+    "DecisionFields": example_decision_fields,
+    "ContinueControl": example_continue_control,
+}
+
+AVAILABLE_EXAMPLES = (
+    "\n".join(
+        ["\nAvailable examples:", "  all - Run all examples"]
+        + [f"  {name}" for name in EXAMPLES]
+    )
+    + "\n"
+)
+
+USAGE = (
+    "Usage: python hooks.py <example_name>\n"
+    + AVAILABLE_EXAMPLES
+    + "\nExample descriptions:\n"
+    "  PreToolUse       - Block commands using PreToolUse hook\n"
+    "  UserPromptSubmit - Add context at prompt submission\n"
+    "  PostToolUse      - Review tool output with reason and systemMessage\n"
+    "  DecisionFields   - Use permissionDecision='allow'/'deny' with reason\n"
+    "  ContinueControl  - Control execution with continue_ and stopReason\n"
+)
+
+
 async def main() -> None:
     """Run all examples or a specific example based on command line argument."""
-    examples = {
-        "PreToolUse": example_pretooluse,
-        "UserPromptSubmit": example_userpromptsubmit,
-        "PostToolUse": example_posttooluse,
-        "DecisionFields": example_decision_fields,
-        "ContinueControl": example_continue_control,
-    }
-
     if len(sys.argv) < 2:
-        # List available examples
-        print("Usage: python hooks.py <example_name>")
-        print("\nAvailable examples:")
-        print("  all - Run all examples")
-        for name in examples:
-            print(f"  {name}")
-        print("\nExample descriptions:")
-        print("  PreToolUse       - Block commands using PreToolUse hook")
-        print("  UserPromptSubmit - Add context at prompt submission")
-        print("  PostToolUse      - Review tool output with reason and systemMessage")
-        print("  DecisionFields   - Use permissionDecision='allow'/'deny' with reason")
-        print("  ContinueControl  - Control execution with continue_ and stopReason")
+        sys.stdout.write(USAGE)
         sys.exit(0)
 
     example_name = sys.argv[1]
 
     if example_name == "all":
         # Run all examples
-        for example in examples.values():
+        for example in EXAMPLES.values():
             await example()
             print("-" * 50 + "\n")
-    elif example_name in examples:
+    elif example_name in EXAMPLES:
         # Run specific example
-        await examples[example_name]()
+        await EXAMPLES[example_name]()
     else:
-        print(f"Error: Unknown example '{example_name}'")
-        print("\nAvailable examples:")
-        print("  all - Run all examples")
-        for name in examples:
-            print(f"  {name}")
+        sys.stdout.write(
+            f"Error: Unknown example '{example_name}'\n" + AVAILABLE_EXAMPLES
+        )
         sys.exit(1)
 
 
 if __name__ == "__main__":
+    # Set up logging to see what's happening
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+
     print("Starting Claude SDK Hooks Examples...")
     print("=" * 50 + "\n")
     asyncio.run(main())
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """Example demonstrating max_budget_usd option for cost control."""
 
+import io
+
 import anyio
+from _util import gather_outputs
 
 from claude_agent_sdk import (
     AssistantMessage,
@@ -14,23 +17,26 @@ from claude_agent_sdk import (
 
 async def without_budget():
     """Example without budget limit."""
-    print("=== Without Budget Limit ===")
+    out = io.StringIO()
+    print("=== Without Budget Limit ===", file=out)
 
     async for message in query(prompt="What is 2 + 2?"):
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
-                    print(f"Claude: {block.text}")
+                    print(f"Claude: {block.text}", file=out)
         elif isinstance(message, ResultMessage):
             if message.total_cost_usd:
-                print(f"Total cost: ${message.total_cost_usd:.4f}")
-            print(f"Status: {message.subtype}")
-    print()
+                print(f"Total cost: ${message.total_cost_usd:.4f}", file=out)
+            print(f"Status: {message.subtype}", file=out)
+    print(file=out)
+    return out.getvalue()
 
 
 async def with_reasonable_budget():
     """Example with budget that won't be exceeded."""
-    print("=== With Reasonable Budget ($0.10) ===")
+    out = io.StringIO()
+    print("=== With Reasonable Budget ($0.10) ===", file=out)
 
     options = ClaudeAgentOptions(
         max_budget_usd=0.10,  # 10 cents - plenty for a simple query
@@ -40,17 +46,19 @@ async def with_reasonable_budget():
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
-                    print(f"Claude: {block.text}")
+                    print(f"Claude: {block.text}", file=out)
         elif isinstance(message, ResultMessage):
             if message.total_cost_usd:
-                print(f"Total cost: ${message.total_cost_usd:.4f}")
-            print(f"Status: {message.subtype}")
-    print()
+                print(f"Total cost: ${message.total_cost_usd:.4f}", file=out)
+            print(f"Status: {message.subtype}", file=out)
+    print(file=out)
+    return out.getvalue()
 
 
 async def with_tight_budget():
     """Example with very tight budget that will likely be exceeded."""
-    print("=== With Tight Budget ($0.0001) ===")
+    out = io.StringIO()
+    print("=== With Tight Budget ($0.0001) ===", file=out)
 
     options = ClaudeAgentOptions(
         max_budget_usd=0.0001,  # Very small budget - will be exceeded quickly
@@ -62,28 +70,31 @@ async def with_tight_budget():
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
-                    print(f"Claude: {block.text}")
+                    print(f"Claude: {block.text}", file=out)
         elif isinstance(message, ResultMessage):
             if message.total_cost_usd:
-                print(f"Total cost: ${message.total_cost_usd:.4f}")
-            print(f"Status: {message.subtype}")
+                print(f"Total cost: ${message.total_cost_usd:.4f}", file=out)
+            print(f"Status: {message.subtype}", file=out)
 
             # Check if budget was exceeded
             if message.subtype == "error_max_budget_usd":
-                print("⚠️  Budget limit exceeded!")
+                print("⚠️  Budget limit exceeded!", file=out)
                 print(
-                    "Note: The cost may exceed the budget by up to one API call's worth"
+                    "Note: The cost may exceed the budget by up to one API call's worth",
+                    file=out,
                 )
-    print()
+    print(file=out)
+    return out.getvalue()
 
 
 async def main():
     """Run all examples."""
     print("This example demonstrates using max_budget_usd to control API costs.\n")
 
-    await without_budget()
-    await with_reasonable_budget()
-    await with_tight_budget()
+    outputs = await gather_outputs(
+        without_budget, with_reasonable_budget, with_tight_budget
+    )
+    print("".join(outputs), end="")
 
     print(
         "\nNote: Budget checking happens after each API call completes,\n"
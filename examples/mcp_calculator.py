@@ -10,14 +10,37 @@ and simpler deployment.
 """
 
 import asyncio
+import math
 from typing import Any
 
 from claude_agent_sdk import (
+    AssistantMessage,
     ClaudeAgentOptions,
+    ClaudeSDKClient,
+    ResultMessage,
+    SystemMessage,
+    TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
     create_sdk_mcp_server,
     tool,
 )
 
+# Rule printed above and below each prompt
+PROMPT_RULE = "=" * 50
+
+
+def text_result(text: str) -> dict[str, Any]:
+    """Build a successful tool response carrying a single text block."""
+    return {"content": [{"type": "text", "text": text}]}
+
+
+def error_result(text: str) -> dict[str, Any]:
+    """Build an error tool response carrying a single text block."""
+    return {"content": [{"type": "text", "text": text}], "is_error": True}
+
+
 # Define calculator tools using the @tool decorator
 
 
@@ -25,44 +48,31 @@ from claude_agent_sdk import (
 async def add_numbers(args: dict[str, Any]) -> dict[str, Any]:
     """Add two numbers together."""
     result = args["a"] + args["b"]
-    return {
-        "content": [{"type": "text", "text": f"{args['a']} + {args['b']} = {result}"}]
-    }
+    return text_result(f"{args['a']} + {args['b']} = {result}")
 
 
 @tool("subtract", "Subtract one number from another", {"a": float, "b": float})
 async def subtract_numbers(args: dict[str, Any]) -> dict[str, Any]:
     """Subtract b from a."""
     result = args["a"] - args["b"]
-    return {
-        "content": [{"type": "text", "text": f"{args['a']} - {args['b']} = {result}"}]
-    }
+    return text_result(f"{args['a']} - {args['b']} = {result}")
 
 
 @tool("multiply", "Multiply two numbers", {"a": float, "b": float})
 async def multiply_numbers(args: dict[str, Any]) -> dict[str, Any]:
     """Multiply two numbers."""
     result = args["a"] * args["b"]
-    return {
-        "content": [{"type": "text", "text": f"{args['a']} × {args['b']} = {result}"}]
-    }
+    return text_result(f"{args['a']} × {args['b']} = {result}")
 
 
 @tool("divide", "Divide one number by another", {"a": float, "b": float})
 async def divide_numbers(args: dict[str, Any]) -> dict[str, Any]:
     """Divide a by b."""
     if args["b"] == 0:
-        return {
-            "content": [
-                {"type": "text", "text": "Error: Division by zero is not allowed"}
-            ],
-            "is_error": True,
-        }
+        return error_result("Error: Division by zero is not allowed")
 
     result = args["a"] / args["b"]
-    return {
-        "content": [{"type": "text", "text": f"{args['a']} ÷ {args['b']} = {result}"}]
-    }
+    return text_result(f"{args['a']} ÷ {args['b']} = {result}")
 
 
 @tool("sqrt", "Calculate square root", {"n": float})
@@ -70,45 +80,23 @@ async def square_root(args: dict[str, Any]) -> dict[str, Any]:
     """Calculate the square root of a number."""
     n = args["n"]
     if n < 0:
-        return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": f"Error: Cannot calculate square root of negative number {n}",
-                }
-            ],
-            "is_error": True,
-        }
-
-    import math
+        return error_result(
+            f"Error: Cannot calculate square root of negative number {n}"
+        )
 
     result = math.sqrt(n)
-    return {"content": [{"type": "text", "text": f"√{n} = {result}"}]}
+    return text_result(f"√{n} = {result}")
 
 
 @tool("power", "Raise a number to a power", {"base": float, "exponent": float})
 async def power(args: dict[str, Any]) -> dict[str, Any]:
     """Raise base to the exponent power."""
     result = args["base"] ** args["exponent"]
-    return {
-        "content": [
-            {"type": "text", "text": f"{args['base']}^{args['exponent']} = {result}"}
-        ]
-    }
+    return text_result(f"{args['base']}^{args['exponent']} = {result}")
 
 
 def display_message(msg):
     """Display message content in a clean format."""
-    from claude_agent_sdk import (
-        AssistantMessage,
-        ResultMessage,
-        SystemMessage,
-        TextBlock,
-        ToolResultBlock,
-        ToolUseBlock,
-        UserMessage,
-    )
-
     if isinstance(msg, UserMessage):
         for block in msg.content:
             if isinstance(block, TextBlock):
@@ -137,8 +125,6 @@ def display_message(msg):
 
 async def main():
     """Run example calculations using the SDK MCP server with streaming client."""
-    from claude_agent_sdk import ClaudeSDKClient
-
     # Create the calculator server with all tools
     calculator = create_sdk_mcp_server(
         name="calculator",
@@ -168,19 +154,17 @@ async def main():
     )
 
     # Example prompts to demonstrate calculator usage
-    prompts = [
+    prompts = (
         "List your tools",
         "Calculate 15 + 27",
         "What is 100 divided by 7?",
         "Calculate the square root of 144",
         "What is 2 raised to the power of 8?",
         "Calculate (12 + 8) * 3 - 10",  # Complex calculation
-    ]
+    )
 
     for prompt in prompts:
-        print(f"\n{'=' * 50}")
-        print(f"Prompt: {prompt}")
-        print(f"{'=' * 50}")
+        print(f"\n{PROMPT_RULE}\nPrompt: {prompt}\n{PROMPT_RULE}")
 
         async with ClaudeSDKClient(options=options) as client:
             await client.query(prompt)
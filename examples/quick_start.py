@@ -2,12 +2,12 @@
 """Quick start example for Claude Code SDK."""
 
 import anyio
+from _util import iter_text
 
 from claude_agent_sdk import (
     AssistantMessage,
     ClaudeAgentOptions,
     ResultMessage,
-    TextBlock,
     query,
 )
 
@@ -18,9 +18,8 @@ async def basic_example():
 
     async for message in query(prompt="What is 2 + 2?"):
         if isinstance(message, AssistantMessage):
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    print(f"Claude: {block.text}")
+            for text in iter_text(message):
+                print(f"Claude: {text}")
     print()
 
 
@@ -37,9 +36,8 @@ async def with_options_example():
         prompt="Explain what Python is in one sentence.", options=options
     ):
         if isinstance(message, AssistantMessage):
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    print(f"Claude: {block.text}")
+            for text in iter_text(message):
+                print(f"Claude: {text}")
     print()
 
 
@@ -57,10 +55,9 @@ async def with_tools_example():
         options=options,
     ):
         if isinstance(message, AssistantMessage):
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    print(f"Claude: {block.text}")
-        elif isinstance(message, ResultMessage) and message.total_cost_usd > 0:
+            for text in iter_text(message):
+                print(f"Claude: {text}")
+        elif isinstance(message, ResultMessage) and message.total_cost_usd:
             print(f"\nCost: ${message.total_cost_usd:.4f}")
     print()
 
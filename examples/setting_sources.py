@@ -26,15 +26,21 @@ Usage:
 """
 
 import asyncio
+import io
 import sys
 from pathlib import Path
 
+from _util import gather_outputs
+
 from claude_agent_sdk import (
     ClaudeAgentOptions,
     ClaudeSDKClient,
     SystemMessage,
 )
 
+# The SDK repo directory, which has .claude/commands/commit.md
+SDK_DIR = Path(__file__).parent.parent
+
 
 def extract_slash_commands(msg: SystemMessage) -> list[str]:
     """Extract slash command names from system message."""
@@ -44,95 +50,99 @@ def extract_slash_commands(msg: SystemMessage) -> list[str]:
     return []
 
 
+async def fetch_slash_commands(client: ClaudeSDKClient) -> list[str]:
+    """Send a simple query and return the commands listed in its init message.
+
+    Only the init message is needed, so the reply is interrupted as soon as it
+    arrives instead of being generated in full.
+    """
+    await client.query("What is 2 + 2?")
+
+    # Check the initialize message for available commands
+    async for msg in client.receive_response():
+        if isinstance(msg, SystemMessage) and msg.subtype == "init":
+            await client.interrupt()
+            return extract_slash_commands(msg)
+    return []
+
+
 async def example_default():
     """Default behavior - no settings loaded."""
-    print("=== Default Behavior Example ===")
-    print("Setting sources: None (default)")
-    print("Expected: No custom slash commands will be available\n")
-
-    sdk_dir = Path(__file__).parent.parent
+    out = io.StringIO()
+    print("=== Default Behavior Example ===", file=out)
+    print("Setting sources: None (default)", file=out)
+    print("Expected: No custom slash commands will be available\n", file=out)
 
     options = ClaudeAgentOptions(
-        cwd=sdk_dir,
+        cwd=SDK_DIR,
     )
 
     async with ClaudeSDKClient(options=options) as client:
-        await client.query("What is 2 + 2?")
+        commands = await fetch_slash_commands(client)
 
-        async for msg in client.receive_response():
-            if isinstance(msg, SystemMessage) and msg.subtype == "init":
-                commands = extract_slash_commands(msg)
-                print(f"Available slash commands: {commands}")
-                if "commit" in commands:
-                    print("❌ /commit is available (unexpected)")
-                else:
-                    print("✓ /commit is NOT available (expected - no settings loaded)")
-                break
+    print(f"Available slash commands: {commands}", file=out)
+    if "commit" in commands:
+        print("❌ /commit is available (unexpected)", file=out)
+    else:
+        print("✓ /commit is NOT available (expected - no settings loaded)", file=out)
 
-    print()
+    print(file=out)
+    return out.getvalue()
 
 
 async def example_user_only():
     """Load only user-level settings, excluding project settings."""
-    print("=== User Settings Only Example ===")
-    print("Setting sources: ['user']")
-    print("Expected: Project slash commands (like /commit) will NOT be available\n")
-
-    # Use the SDK repo directory which has .claude/commands/commit.md
-    sdk_dir = Path(__file__).parent.parent
+    out = io.StringIO()
+    print("=== User Settings Only Example ===", file=out)
+    print("Setting sources: ['user']", file=out)
+    print(
+        "Expected: Project slash commands (like /commit) will NOT be available\n",
+        file=out,
+    )
 
     options = ClaudeAgentOptions(
         setting_sources=["user"],
-        cwd=sdk_dir,
+        cwd=SDK_DIR,
     )
 
     async with ClaudeSDKClient(options=options) as client:
-        # Send a simple query
-        await client.query("What is 2 + 2?")
+        commands = await fetch_slash_commands(client)
 
-        # Check the initialize message for available commands
-        async for msg in client.receive_response():
-            if isinstance(msg, SystemMessage) and msg.subtype == "init":
-                commands = extract_slash_commands(msg)
-                print(f"Available slash commands: {commands}")
-                if "commit" in commands:
-                    print("❌ /commit is available (unexpected)")
-                else:
-                    print("✓ /commit is NOT available (expected)")
-                break
+    print(f"Available slash commands: {commands}", file=out)
+    if "commit" in commands:
+        print("❌ /commit is available (unexpected)", file=out)
+    else:
+        print("✓ /commit is NOT available (expected)", file=out)
 
-    print()
+    print(file=out)
+    return out.getvalue()
 
 
 async def example_project_and_user():
     """Load both project and user settings."""
-    print("=== Project + User Settings Example ===")
-    print("Setting sources: ['user', 'project']")
-    print("Expected: Project slash commands (like /commit) WILL be available\n")
-
-    sdk_dir = Path(__file__).parent.parent
+    out = io.StringIO()
+    print("=== Project + User Settings Example ===", file=out)
+    print("Setting sources: ['user', 'project']", file=out)
+    print(
+        "Expected: Project slash commands (like /commit) WILL be available\n", file=out
+    )
 
     options = ClaudeAgentOptions(
         setting_sources=["user", "project"],
-        cwd=sdk_dir,
+        cwd=SDK_DIR,
     )
 
     async with ClaudeSDKClient(options=options) as client:
-        await client.query("What is 2 + 2?")
-
-        async for msg in client.receive_response():
-            if isinstance(msg, SystemMessage) and msg.subtype == "init":
-                commands = extract_slash_commands(msg)
-                print(f"Available slash commands: {commands}")
-                if "commit" in commands:
-                    print("✓ /commit is available (expected)")
-                else:
-                    print("❌ /commit is NOT available (unexpected)")
-                break
-
-    print()
+        commands = await fetch_slash_commands(client)
 
+    print(f"Available slash commands: {commands}", file=out)
+    if "commit" in commands:
+        print("✓ /commit is available (expected)", file=out)
+    else:
+        print("❌ /commit is NOT available (unexpected)", file=out)
 
+    print(file=out)
+    return out.getvalue()
 
 
 async def main():
@@ -154,11 +164,14 @@ async def main():
     example_name = sys.argv[1]
 
     if example_name == "all":
-        for example in examples.values():
-            await example()
+        # Each example runs its own CLI, so run them concurrently and print
+        # their buffered output in order once all have finished
+        outputs = await gather_outputs(*examples.values())
+        for output in outputs:
+            print(output, end="")
             print("-" * 50 + "\n")
     elif example_name in examples:
-        await examples[example_name]()
+        print(await examples[example_name](), end="")
     else:
         print(f"Error: Unknown example '{example_name}'")
         print("\nAvailable examples:")
@@ -171,4 +184,4 @@ async def main():
 if __name__ == "__main__":
     print("Starting Claude SDK Setting Sources Examples...")
     print("=" * 50 + "\n")
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
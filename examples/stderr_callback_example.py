@@ -1,18 +1,29 @@
 """Simple example demonstrating stderr callback for capturing CLI debug output."""
 
 import asyncio
+from collections import deque
 
 from claude_agent_sdk import ClaudeAgentOptions, query
 
+# Number of recent stderr lines to retain
+STDERR_HISTORY = 1000
+
 
 async def main():
     """Capture stderr output from the CLI using a callback."""
 
-    # Collect stderr messages
-    stderr_messages = []
+    # Keep only the most recent stderr lines so a long debug run cannot grow
+    # memory without bound; count every line and remember the first one
+    stderr_messages: deque[str] = deque(maxlen=STDERR_HISTORY)
+    stderr_line_count = 0
+    first_stderr_line = None
 
     def stderr_callback(message: str):
         """Callback that receives each line of stderr output."""
+        nonlocal stderr_line_count, first_stderr_line
+        if first_stderr_line is None:
+            first_stderr_line = message
+        stderr_line_count += 1
         stderr_messages.append(message)
         # Optionally print specific messages
         if "[ERROR]" in message:
@@ -35,9 +46,11 @@ async def main():
                 print(f"Response: {message.content}")
 
     # Show what we captured
-    print(f"\nCaptured {len(stderr_messages)} stderr lines")
+    print(f"\nCaptured {stderr_line_count} stderr lines")
+    if first_stderr_line is not None:
+        print("First stderr line:", first_stderr_line[:100])
     if stderr_messages:
-        print("First stderr line:", stderr_messages[0][:100])
+        print("Last stderr line:", stderr_messages[-1][:100])
 
 
 if __name__ == "__main__":
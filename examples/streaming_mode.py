@@ -17,21 +17,37 @@ Usage:
 
 import asyncio
 import contextlib
+import re
 import sys
 
+from _util import iter_text, print_text_blocks
+
 from claude_agent_sdk import (
     AssistantMessage,
     ClaudeAgentOptions,
     ClaudeSDKClient,
     CLIConnectionError,
     ResultMessage,
-    SystemMessage,
     TextBlock,
     ToolResultBlock,
     ToolUseBlock,
     UserMessage,
 )
 
+# Language names picked out by example_manual_message_handling, matched as
+# whole words in one pass so e.g. "Java" is not found inside "JavaScript"
+LANGUAGES = ("Python", "JavaScript", "Java", "C++", "Go", "Rust", "Ruby")
+_LANGUAGE_ALTERNATION = "|".join(map(re.escape, LANGUAGES))
+LANGUAGE_RE = re.compile(rf"(?<!\w)(?:{_LANGUAGE_ALTERNATION})(?!\w)")
+
+
+# Display handlers keyed by exact message type; anything else is ignored
+MESSAGE_DISPLAY = {
+    UserMessage: lambda msg: print_text_blocks(msg, "User"),
+    AssistantMessage: lambda msg: print_text_blocks(msg, "Claude"),
+    ResultMessage: lambda msg: print("Result ended"),
+}
+
 
 def display_message(msg):
     """Standardized message display function.
@@ -41,19 +57,9 @@ def display_message(msg):
     - SystemMessage: ignored
     - ResultMessage: "Result ended" + cost if available
     """
-    if isinstance(msg, UserMessage):
-        for block in msg.content:
-            if isinstance(block, TextBlock):
-                print(f"User: {block.text}")
-    elif isinstance(msg, AssistantMessage):
-        for block in msg.content:
-            if isinstance(block, TextBlock):
-                print(f"Claude: {block.text}")
-    elif isinstance(msg, SystemMessage):
-        # Ignore system messages
-        pass
-    elif isinstance(msg, ResultMessage):
-        print("Result ended")
+    handler = MESSAGE_DISPLAY.get(type(msg))
+    if handler is not None:
+        handler(msg)
 
 
 async def example_basic_streaming():
@@ -99,33 +105,36 @@ async def example_concurrent_responses():
     print("=== Concurrent Send/Receive Example ===")
 
     async with ClaudeSDKClient() as client:
+        # Set by the receiver each time a response finishes
+        response_done = asyncio.Event()
+
         # Background task to continuously receive messages
         async def receive_messages():
             async for message in client.receive_messages():
                 display_message(message)
+                if isinstance(message, ResultMessage):
+                    response_done.set()
 
-        # Start receiving in background
-        receive_task = asyncio.create_task(receive_messages())
-
-        # Send multiple messages with delays
-        questions = [
+        # Send each message as soon as the previous response has finished
+        questions = (
             "What is 2 + 2?",
             "What is the square root of 144?",
             "What is 10% of 80?",
-        ]
+        )
 
-        for question in questions:
-            print(f"\nUser: {question}")
-            await client.query(question)
-            await asyncio.sleep(3)  # Wait between messages
+        # The task group waits for the receiver on exit and cancels it if a
+        # send fails, so it cannot outlive the client
+        async with asyncio.TaskGroup() as tg:
+            receive_task = tg.create_task(receive_messages())
 
-        # Give time for final responses
-        await asyncio.sleep(2)
+            for question in questions:
+                response_done.clear()
+                print(f"\nUser: {question}")
+                await client.query(question)
+                await response_done.wait()
 
-        # Clean up
-        receive_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await receive_task
+            # Clean up
+            receive_task.cancel()
 
     print("\n")
 
@@ -142,25 +151,21 @@ async def example_with_interrupt():
             "Count from 1 to 100 slowly, with a brief pause between each number"
         )
 
-        # Create a background task to consume messages
-        messages_received = []
+        async def interrupt_after_delay():
+            """Wait 2 seconds then send interrupt."""
+            await asyncio.sleep(2)
+            print("\n[After 2 seconds, sending interrupt...]")
+            await client.interrupt()
 
-        async def consume_messages():
-            """Consume messages in the background to enable interrupt processing."""
+        # Only the interrupt needs its own task; consuming messages here is
+        # what lets the interrupt be processed
+        async with asyncio.TaskGroup() as tg:
+            interrupt_task = tg.create_task(interrupt_after_delay())
             async for message in client.receive_response():
-                messages_received.append(message)
                 display_message(message)
 
-        # Start consuming messages in the background
-        consume_task = asyncio.create_task(consume_messages())
-
-        # Wait 2 seconds then send interrupt
-        await asyncio.sleep(2)
-        print("\n[After 2 seconds, sending interrupt...]")
-        await client.interrupt()
-
-        # Wait for the consume task to finish processing the interrupt
-        await consume_task
+            # The response may have finished before the interrupt was sent
+            interrupt_task.cancel()
 
         # Send new instruction after interrupt
         print("\nUser: Never mind, just tell me a quick joke")
@@ -181,27 +186,25 @@ async def example_manual_message_handling():
         await client.query("List 5 programming languages and their main use cases")
 
         # Manually process messages with custom logic
-        languages_found = []
+        languages_found = set()
+        interrupted = False
 
         async for message in client.receive_messages():
             if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        text = block.text
-                        print(f"Claude: {text}")
-                        # Custom logic: extract language names
-                        for lang in [
-                            "Python",
-                            "JavaScript",
-                            "Java",
-                            "C++",
-                            "Go",
-                            "Rust",
-                            "Ruby",
-                        ]:
-                            if lang in text and lang not in languages_found:
-                                languages_found.append(lang)
-                                print(f"Found language: {lang}")
+                for text in iter_text(message):
+                    print(f"Claude: {text}")
+                    # Custom logic: extract language names
+                    for match in LANGUAGE_RE.finditer(text):
+                        lang = match.group()
+                        if lang not in languages_found:
+                            languages_found.add(lang)
+                            print(f"Found language: {lang}")
+                # Nothing left to look for, so stop the rest of the response;
+                # the ResultMessage still arrives and ends the loop
+                if not interrupted and len(languages_found) == len(LANGUAGES):
+                    print("[All languages found, interrupting...]")
+                    await client.interrupt()
+                    interrupted = True
             elif isinstance(message, ResultMessage):
                 display_message(message)
                 print(f"Total languages mentioned: {len(languages_found)}")
@@ -229,15 +232,11 @@ async def example_with_options():
 
         tool_uses = []
         async for msg in client.receive_response():
-            if isinstance(msg, AssistantMessage):
-                display_message(msg)
-                for block in msg.content:
-                    if hasattr(block, "name") and not isinstance(
-                        block, TextBlock
-                    ):  # ToolUseBlock
-                        tool_uses.append(getattr(block, "name", ""))
-            else:
-                display_message(msg)
+            display_message(msg)
+            if type(msg) is AssistantMessage:
+                tool_uses.extend(
+                    block.name for block in msg.content if type(block) is ToolUseBlock
+                )
 
         if tool_uses:
             print(f"Tools used: {', '.join(tool_uses)}")
@@ -376,16 +375,13 @@ async def example_control_protocol():
         await client.query("Count from 1 to 20 slowly, pausing between each number")
 
         # Start consuming messages in background to enable interrupt
-        messages = []
         async def consume():
             async for msg in client.receive_response():
-                messages.append(msg)
                 if isinstance(msg, AssistantMessage):
-                    for block in msg.content:
-                        if isinstance(block, TextBlock):
-                            # Print first 50 chars to show progress
-                            print(f"Claude: {block.text[:50]}...")
-                            break
+                    for text in iter_text(msg):
+                        # Print first 50 chars to show progress
+                        print(f"Claude: {text[:50]}...")
+                        break
                 if isinstance(msg, ResultMessage):
                     break
 
@@ -410,10 +406,8 @@ async def example_control_protocol():
         await client.query("Just say 'Hello!'")
 
         async for msg in client.receive_response():
-            if isinstance(msg, AssistantMessage):
-                for block in msg.content:
-                    if isinstance(block, TextBlock):
-                        print(f"Claude: {block.text}")
+            if type(msg) is AssistantMessage:
+                print_text_blocks(msg, "Claude")
 
     print("\n")
 
@@ -433,14 +427,13 @@ async def example_error_handling():
 
         # Try to receive response with a short timeout
         try:
-            messages = []
+            received = 0
             async with asyncio.timeout(10.0):
                 async for msg in client.receive_response():
-                    messages.append(msg)
+                    received += 1
                     if isinstance(msg, AssistantMessage):
-                        for block in msg.content:
-                            if isinstance(block, TextBlock):
-                                print(f"Claude: {block.text[:50]}...")
+                        for text in iter_text(msg):
+                            print(f"Claude: {text[:50]}...")
                     elif isinstance(msg, ResultMessage):
                         display_message(msg)
                         break
@@ -449,7 +442,7 @@ async def example_error_handling():
             print(
                 "\nResponse timeout after 10 seconds - demonstrating graceful handling"
             )
-            print(f"Received {len(messages)} messages before timeout")
+            print(f"Received {received} messages before timeout")
 
     except CLIConnectionError as e:
         print(f"Connection error: {e}")
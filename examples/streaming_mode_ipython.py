@@ -98,33 +98,25 @@ async with ClaudeSDKClient() as client:
     print("User: Count from 1 to 100, run bash sleep for 1 second in between")
     await client.query("Count from 1 to 100, run bash sleep for 1 second in between")
 
-    # Create a background task to consume messages
-    messages_received = []
-    interrupt_sent = False
+    async def interrupt_after_delay():
+        # Wait a bit then send interrupt
+        await asyncio.sleep(10)
+        print("\n--- Sending interrupt ---\n")
+        await client.interrupt()
 
-    async def consume_messages():
-        async for msg in client.receive_messages():
-            messages_received.append(msg)
+    # Only the interrupt runs in the background; consuming here is what lets
+    # it be processed, and receive_response() stops at the ResultMessage
+    async with asyncio.TaskGroup() as tg:
+        interrupt_task = tg.create_task(interrupt_after_delay())
+
+        async for msg in client.receive_response():
             if isinstance(msg, AssistantMessage):
                 for block in msg.content:
                     if isinstance(block, TextBlock):
                         print(f"Claude: {block.text}")
 
-            # Check if we got a result after interrupt
-            if isinstance(msg, ResultMessage) and interrupt_sent:
-                break
-
-    # Start consuming messages in the background
-    consume_task = asyncio.create_task(consume_messages())
-
-    # Wait a bit then send interrupt
-    await asyncio.sleep(10)
-    print("\n--- Sending interrupt ---\n")
-    interrupt_sent = True
-    await client.interrupt()
-
-    # Wait for the consume task to finish
-    await consume_task
+        # The task may have finished before the interrupt was sent
+        interrupt_task.cancel()
 
     # Send a new message after interrupt
     print("\n--- After interrupt, sending new message ---\n")
@@ -149,10 +141,8 @@ try:
         await client.query("Run a bash sleep command for 60 seconds")
 
         # Timeout after 20 seconds
-        messages = []
         async with asyncio.timeout(20.0):
             async for msg in client.receive_response():
-                messages.append(msg)
                 if isinstance(msg, AssistantMessage):
                     for block in msg.content:
                         if isinstance(block, TextBlock):
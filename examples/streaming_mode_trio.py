@@ -8,6 +8,7 @@ Claude's responses.
 """
 
 import trio
+from _util import print_text_blocks
 
 from claude_agent_sdk import (
     AssistantMessage,
@@ -15,7 +16,6 @@ from claude_agent_sdk import (
     ClaudeSDKClient,
     ResultMessage,
     SystemMessage,
-    TextBlock,
     UserMessage,
 )
 
@@ -29,13 +29,9 @@ def display_message(msg):
     - ResultMessage: "Result ended" + cost if available
     """
     if isinstance(msg, UserMessage):
-        for block in msg.content:
-            if isinstance(block, TextBlock):
-                print(f"User: {block.text}")
+        print_text_blocks(msg, "User")
     elif isinstance(msg, AssistantMessage):
-        for block in msg.content:
-            if isinstance(block, TextBlock):
-                print(f"Claude: {block.text}")
+        print_text_blocks(msg, "Claude")
     elif isinstance(msg, SystemMessage):
         # Ignore system messages
         pass
@@ -22,6 +22,68 @@ from claude_agent_sdk import (
 # Track tool usage for demonstration
 tool_usage_log = []
 
+# Bash command fragments we refuse to run
+DANGEROUS_COMMANDS = ("rm -rf", "sudo", "chmod 777", "dd if=", "mkfs")
+
+
+def check_read(
+    tool_name: str, input_data: dict
+) -> PermissionResultAllow | PermissionResultDeny | None:
+    """Always allow read operations."""
+    print(f"   ✅ Automatically allowing {tool_name} (read-only operation)")
+    return PermissionResultAllow()
+
+
+def check_write(
+    tool_name: str, input_data: dict
+) -> PermissionResultAllow | PermissionResultDeny | None:
+    """Deny writes to system directories and redirect other writes."""
+    file_path = input_data.get("file_path", "")
+    if file_path.startswith(("/etc/", "/usr/")):
+        print(f"   ❌ Denying write to system directory: {file_path}")
+        return PermissionResultDeny(
+            message=f"Cannot write to system directory: {file_path}"
+        )
+
+    # Redirect writes to a safe directory
+    if not file_path.startswith(("/tmp/", "./")):
+        safe_path = f"./safe_output/{file_path.split('/')[-1]}"
+        print(f"   ⚠️  Redirecting write from {file_path} to {safe_path}")
+        modified_input = {**input_data, "file_path": safe_path}
+        return PermissionResultAllow(updated_input=modified_input)
+
+    # Defer to the user for anything else
+    return None
+
+
+def check_bash(
+    tool_name: str, input_data: dict
+) -> PermissionResultAllow | PermissionResultDeny | None:
+    """Deny dangerous bash commands."""
+    command = input_data.get("command", "")
+    dangerous = next((p for p in DANGEROUS_COMMANDS if p in command), None)
+    if dangerous is not None:
+        print(f"   ❌ Denying dangerous command: {command}")
+        return PermissionResultDeny(
+            message=f"Dangerous command pattern detected: {dangerous}"
+        )
+
+    # Allow but log the command
+    print(f"   ✅ Allowing bash command: {command}")
+    return PermissionResultAllow()
+
+
+# Per-tool permission checks, looked up once per request
+TOOL_CHECKS = {
+    "Read": check_read,
+    "Glob": check_read,
+    "Grep": check_read,
+    "Write": check_write,
+    "Edit": check_write,
+    "MultiEdit": check_write,
+    "Bash": check_bash,
+}
+
 
 async def my_permission_callback(
     tool_name: str,
@@ -40,45 +102,11 @@ async def my_permission_callback(
     print(f"\n🔧 Tool Permission Request: {tool_name}")
     print(f"   Input: {json.dumps(input_data, indent=2)}")
 
-    # Always allow read operations
-    if tool_name in ["Read", "Glob", "Grep"]:
-        print(f"   ✅ Automatically allowing {tool_name} (read-only operation)")
-        return PermissionResultAllow()
-
-    # Deny write operations to system directories
-    if tool_name in ["Write", "Edit", "MultiEdit"]:
-        file_path = input_data.get("file_path", "")
-        if file_path.startswith("/etc/") or file_path.startswith("/usr/"):
-            print(f"   ❌ Denying write to system directory: {file_path}")
-            return PermissionResultDeny(
-                message=f"Cannot write to system directory: {file_path}"
-            )
-
-        # Redirect writes to a safe directory
-        if not file_path.startswith("/tmp/") and not file_path.startswith("./"):
-            safe_path = f"./safe_output/{file_path.split('/')[-1]}"
-            print(f"   ⚠️  Redirecting write from {file_path} to {safe_path}")
-            modified_input = input_data.copy()
-            modified_input["file_path"] = safe_path
-            return PermissionResultAllow(
-                updated_input=modified_input
-            )
-
-    # Check dangerous bash commands
-    if tool_name == "Bash":
-        command = input_data.get("command", "")
-        dangerous_commands = ["rm -rf", "sudo", "chmod 777", "dd if=", "mkfs"]
-
-        for dangerous in dangerous_commands:
-            if dangerous in command:
-                print(f"   ❌ Denying dangerous command: {command}")
-                return PermissionResultDeny(
-                    message=f"Dangerous command pattern detected: {dangerous}"
-                )
-
-        # Allow but log the command
-        print(f"   ✅ Allowing bash command: {command}")
-        return PermissionResultAllow()
+    check = TOOL_CHECKS.get(tool_name)
+    if check is not None:
+        result = check(tool_name, input_data)
+        if result is not None:
+            return result
 
     # For all other tools, ask the user
     print(f"   ❓ Unknown tool: {tool_name}")
@@ -39,18 +39,21 @@ def run_command(cmd: list[str], description: str) -> None:
     print(f"$ {' '.join(cmd)}")
     print()
 
-    try:
-        result = subprocess.run(
-            cmd,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-        print(result.stdout)
-    except subprocess.CalledProcessError as e:
+    # Forward output as it arrives so long steps show progress
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            print(line, end="", flush=True)
+    print()
+
+    if process.returncode != 0:
         print(f"Error: {description} failed", file=sys.stderr)
-        print(e.stdout, file=sys.stderr)
         sys.exit(1)
 
 
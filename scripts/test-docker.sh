@@ -51,7 +51,7 @@ case "${1:-unit}" in
         echo ""
         echo "Running e2e tests in Docker..."
         docker run --rm -e ANTHROPIC_API_KEY \
-            claude-sdk-test python -m pytest e2e-tests/ -v -m e2e
+            claude-sdk-test python -m pytest e2e-tests/ -v -m e2e -n auto
         ;;
     all)
         echo ""
@@ -63,7 +63,7 @@ case "${1:-unit}" in
         if [ -n "$ANTHROPIC_API_KEY" ]; then
             echo "Running e2e tests in Docker..."
             docker run --rm -e ANTHROPIC_API_KEY \
-                claude-sdk-test python -m pytest e2e-tests/ -v -m e2e
+                claude-sdk-test python -m pytest e2e-tests/ -v -m e2e -n auto
         else
             echo "Skipping e2e tests (ANTHROPIC_API_KEY not set)"
         fi
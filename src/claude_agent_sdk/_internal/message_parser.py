@@ -44,7 +44,22 @@ def parse_message(data: dict[str, Any]) -> Message:
     if not message_type:
         raise MessageParseError("Message missing 'type' field", data)
 
+    # stream_event comes first: with include_partial_messages the CLI emits one
+    # per token delta, far outnumbering every other message type
     match message_type:
+        case "stream_event":
+            try:
+                return StreamEvent(
+                    uuid=data["uuid"],
+                    session_id=data["session_id"],
+                    event=data["event"],
+                    parent_tool_use_id=data.get("parent_tool_use_id"),
+                )
+            except KeyError as e:
+                raise MessageParseError(
+                    f"Missing required field in stream_event message: {e}", data
+                ) from e
+
         case "user":
             try:
                 parent_tool_use_id = data.get("parent_tool_use_id")
@@ -160,18 +175,5 @@ def parse_message(data: dict[str, Any]) -> Message:
                     f"Missing required field in result message: {e}", data
                 ) from e
 
-        case "stream_event":
-            try:
-                return StreamEvent(
-                    uuid=data["uuid"],
-                    session_id=data["session_id"],
-                    event=data["event"],
-                    parent_tool_use_id=data.get("parent_tool_use_id"),
-                )
-            except KeyError as e:
-                raise MessageParseError(
-                    f"Missing required field in stream_event message: {e}", data
-                ) from e
-
         case _:
             raise MessageParseError(f"Unknown message type: {message_type}", data)
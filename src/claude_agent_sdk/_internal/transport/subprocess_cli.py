@@ -596,6 +596,11 @@ class SubprocessCLITransport(Transport):
                             ),
                         )
 
+                    # Every message is a JSON object, so skip re-decoding the
+                    # whole buffer while it cannot yet hold a complete one
+                    if not json_buffer.endswith("}"):
+                        continue
+
                     try:
                         data = json.loads(json_buffer)
                         json_buffer = ""
@@ -3,7 +3,7 @@
 import json
 from collections.abc import AsyncIterator
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import anyio
 import pytest
@@ -183,6 +183,42 @@ class TestSubprocessBuffering:
 
         anyio.run(_test)
 
+    def test_split_json_decoded_once(self) -> None:
+        """Test that partial reads that cannot close an object are not decoded."""
+
+        async def _test() -> None:
+            json_obj = {
+                "type": "assistant",
+                "message": {"content": [{"type": "text", "text": "x" * 1000}]},
+            }
+            complete_json = json.dumps(json_obj)
+
+            # Every split point falls inside the run of x's
+            chunks = [complete_json[i : i + 100] for i in range(0, 900, 100)]
+            chunks.append(complete_json[900:])
+
+            transport = SubprocessCLITransport(prompt="test", options=make_options())
+
+            mock_process = MagicMock()
+            mock_process.returncode = None
+            mock_process.wait = AsyncMock(return_value=None)
+            transport._process = mock_process
+            transport._stdout_stream = MockTextReceiveStream(chunks)
+            transport._stderr_stream = MockTextReceiveStream([])
+
+            messages: list[Any] = []
+            with patch(
+                "claude_agent_sdk._internal.transport.subprocess_cli.json.loads",
+                wraps=json.loads,
+            ) as mock_loads:
+                async for msg in transport.read_messages():
+                    messages.append(msg)
+
+            assert messages == [json_obj]
+            assert mock_loads.call_count == 1
+
+        anyio.run(_test)
+
     def test_large_minified_json(self) -> None:
         """Test parsing a large minified JSON (simulating the reported issue)."""
 
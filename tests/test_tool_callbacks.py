@@ -2,6 +2,7 @@
 
 import json
 
+import anyio
 import pytest
 
 from claude_agent_sdk import (
@@ -261,6 +262,52 @@ class TestHookCallbacks:
         last_response = transport.written_messages[-1]
         assert '"processed": true' in last_response
 
+    @pytest.mark.asyncio
+    async def test_slow_hook_does_not_block_message_stream(self):
+        """Test that a pending hook callback does not hold up regular messages."""
+        release_hook = anyio.Event()
+
+        async def slow_hook(
+            input_data: HookInput, tool_use_id: str | None, context: HookContext
+        ) -> dict:
+            await release_hook.wait()
+            return {"processed": True}
+
+        transport = MockTransport()
+        transport.messages_to_read = [
+            {
+                "type": "control_request",
+                "request_id": "test-hook-slow",
+                "request": {
+                    "subtype": "hook_callback",
+                    "callback_id": "slow_hook_0",
+                    "input": {"test": "data"},
+                    "tool_use_id": "tool-123",
+                },
+            },
+            {"type": "assistant", "message": {"content": []}},
+        ]
+
+        query = Query(transport=transport, is_streaming_mode=True)
+        query.hook_callbacks["slow_hook_0"] = slow_hook
+
+        received = []
+        try:
+            await query.start()
+            with anyio.fail_after(5):
+                # The hook only finishes once a regular message has arrived
+                async for message in query.receive_messages():
+                    received.append(message)
+                    release_hook.set()
+
+                while not transport.written_messages:
+                    await anyio.sleep(0.01)
+        finally:
+            await query.close()
+
+        assert [message["type"] for message in received] == ["assistant"]
+        assert '"processed": true' in transport.written_messages[-1]
+
     @pytest.mark.asyncio
     async def test_hook_output_fields(self):
         """Test that all SyncHookJSONOutput fields are properly handled."""